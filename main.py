@@ -3,7 +3,6 @@
 import logging
 
 from reflex_docs_mcp.bootstrap import ensure_index, env_flag
-from reflex_docs_mcp.server import mcp, main as run_main
 
 # Configure logging
 logging.basicConfig(
@@ -11,11 +10,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# FastMCP hosting expects a top-level server object named
-# mcp/server/app. We export mcp and alias app for compatibility.
-app = mcp
+
+def __getattr__(name: str):
+    # FastMCP hosting expects a top-level server object named
+    # mcp/server/app. We export mcp and alias app for compatibility, importing
+    # the server lazily so startup paths that don't need it skip the cost.
+    if name in ("mcp", "app"):
+        from reflex_docs_mcp.server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    from reflex_docs_mcp.server import main as run_main
+
     if env_flag("REFLEX_DOCS_AUTO_INDEX", True):
         ensure_index()
     run_main()
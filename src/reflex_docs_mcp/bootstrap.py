@@ -6,16 +6,18 @@ import logging
 import os
 from pathlib import Path
 
-from . import database, indexer
+from . import database
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
 
 def env_flag(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
 def ensure_index() -> None:
@@ -24,6 +26,9 @@ def ensure_index() -> None:
     if database.is_index_ready():
         return
 
+    # The indexer pulls in GitPython; only import it when a build is needed.
+    from . import indexer
+
     docs_src = Path(os.getenv("REFLEX_DOCS_DOCS_SRC", str(indexer.DEFAULT_DOCS_SRC)))
     force_clone = env_flag("REFLEX_DOCS_FORCE_CLONE", False)
     skip_clone = env_flag("REFLEX_DOCS_SKIP_CLONE", False)
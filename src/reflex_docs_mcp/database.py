@@ -7,10 +7,13 @@ import re
 import sqlite3
 import threading
 import time
+import weakref
 from pathlib import Path
 from contextlib import contextmanager, nullcontext
 from typing import Generator, Iterable
 
+# Result models are built with model_construct(): rows come from our own
+# typed, NOT NULL schema, so per-field validation would be pure overhead.
 from .models import DocResult, DocSection, DocPage, DocPageInfo, ComponentInfo
 
 # Default database path
@@ -20,15 +23,29 @@ DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "reflex_docs.db
 REFLEX_DOCS_BASE_URL = "https://reflex.dev/docs"
 
 
+@functools.lru_cache(maxsize=1)
 def get_db_path() -> Path:
-    """Get the database path, creating parent directories if needed."""
-    db_path = DEFAULT_DB_PATH
+    """Get the database path, creating parent directories if needed.
+
+    REFLEX_DOCS_DB_PATH overrides the default, so a prebuilt or cached index
+    can be reused across deployments instead of rebuilt at startup.
+
+    Cached so the mkdir only runs on the first call, not for every new
+    thread connection; call get_db_path.cache_clear() after changing
+    DEFAULT_DB_PATH or REFLEX_DOCS_DB_PATH.
+    """
+    db_path = Path(os.getenv("REFLEX_DOCS_DB_PATH") or DEFAULT_DB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return db_path
 
 
 _thread_local = threading.local()
 
+# Registry of open per-thread connections, keyed by thread id, so shutdown
+# can close them all. Entries are dropped when their thread exits.
+_connections: dict[int, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
 
 def _apply_pragmas(conn: sqlite3.Connection) -> None:
     """Apply performance-related pragmas to the connection."""
@@ -37,30 +54,85 @@ def _apply_pragmas(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA temp_store=MEMORY")
     # Negative cache_size means KB. -64000 ~= 64MB page cache.
     conn.execute("PRAGMA cache_size=-64000")
-    conn.execute("PRAGMA foreign_keys=ON")
+    # Memory-map up to 256MB so reads skip the read() syscall path.
     conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA foreign_keys=ON")
 
 
 def _get_thread_connection() -> sqlite3.Connection:
     """Get or create a per-thread SQLite connection."""
     conn = getattr(_thread_local, "conn", None)
-    if conn is None:
-        conn = sqlite3.connect(get_db_path(), timeout=30, check_same_thread=False)
+    thread_id = threading.get_ident()
+    # A connection closed by close_all_connections() is no longer registered
+    if conn is None or _connections.get(thread_id) is not conn:
+        # Query SQL is constant text, so sqlite3's per-connection statement
+        # cache serves repeat calls without re-preparing them.
+        conn = sqlite3.connect(
+            get_db_path(),
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=256,
+        )
         conn.row_factory = sqlite3.Row
         _apply_pragmas(conn)
         _thread_local.conn = conn
+        with _connections_lock:
+            _connections[thread_id] = conn
+        # Close the connection once its thread is gone; at interpreter exit
+        # close_all_connections() handles it instead.
+        finalizer = weakref.finalize(
+            threading.current_thread(), _release_connection, thread_id, conn
+        )
+        finalizer.atexit = False
     return conn
 
 
+def _unregister(thread_id: int, conn: sqlite3.Connection) -> None:
+    """Drop a connection from the registry if it is still the thread's entry."""
+    with _connections_lock:
+        # Thread ids are reused, so another thread may own the slot by now
+        if _connections.get(thread_id) is conn:
+            del _connections[thread_id]
+
+
+def _release_connection(thread_id: int, conn: sqlite3.Connection) -> None:
+    """Unregister and close the connection of a thread that has exited."""
+    _unregister(thread_id, conn)
+    conn.close()
+
+
+def _close(conn: sqlite3.Connection, checkpoint: bool = False) -> None:
+    """Close a connection, refreshing planner stats first."""
+    try:
+        # Refresh planner statistics for tables that changed this session.
+        conn.execute("PRAGMA optimize")
+        if checkpoint:
+            # Fold the WAL back into the database so it doesn't keep growing.
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
 def close_connection() -> None:
     """Close the current thread's connection, if any."""
     conn = getattr(_thread_local, "conn", None)
     if conn is not None:
-        conn.close()
         _thread_local.conn = None
+        _unregister(threading.get_ident(), conn)
+        _close(conn)
+
 
+def close_all_connections() -> None:
+    """Close every thread's connection and checkpoint the WAL."""
+    with _connections_lock:
+        conns = list(_connections.values())
+        _connections.clear()
+    for conn in conns:
+        _close(conn, checkpoint=True)
 
-atexit.register(close_connection)
+
+atexit.register(close_all_connections)
 
 
 @contextmanager
@@ -70,6 +142,22 @@ def get_connection() -> Generator[sqlite3.Connection, None, None]:
     yield conn
 
 
+@contextmanager
+def raw_connection() -> Generator[sqlite3.Connection, None, None]:
+    """Get the cached connection with rows returned as plain tuples.
+
+    For hot paths that unpack columns by position and don't need the
+    sqlite3.Row wrapper; the row factory is restored on exit.
+    """
+    with get_connection() as conn:
+        row_factory = conn.row_factory
+        conn.row_factory = None
+        try:
+            yield conn
+        finally:
+            conn.row_factory = row_factory
+
+
 @contextmanager
 def transaction() -> Generator[sqlite3.Connection, None, None]:
     """Run operations inside a single transaction."""
@@ -83,8 +171,112 @@ def transaction() -> Generator[sqlite3.Connection, None, None]:
             raise
 
 
+@contextmanager
+def bulk_load_connection() -> Generator[sqlite3.Connection, None, None]:
+    """Open a dedicated write connection for a bulk load, in one transaction.
+
+    The index is rebuildable from the docs source, so durability is traded
+    for speed: the connection skips fsync and, when no other connection has
+    the database open, holds an exclusive lock for the whole load. Other
+    connections keep the regular pragmas from _apply_pragmas().
+    """
+    # An open WAL connection keeps a shared lock, so release ours first.
+    close_connection()
+    conn = sqlite3.connect(get_db_path(), timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    # Negative cache_size means KB. -262144 ~= 256MB page cache.
+    conn.execute("PRAGMA cache_size=-262144")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    conn.execute("PRAGMA busy_timeout=0")
+    try:
+        conn.execute("BEGIN EXCLUSIVE")
+    except sqlite3.OperationalError:
+        # Another connection (e.g. a server thread) is open; load without
+        # the exclusive lock rather than failing.
+        conn.execute("PRAGMA locking_mode=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("BEGIN")
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        try:
+            conn.execute("PRAGMA analysis_limit=1000")
+            conn.execute("PRAGMA optimize")
+        finally:
+            conn.close()
+
+
+# Triggers that keep the FTS tables in sync with their content tables.
+_FTS_TRIGGERS = {
+    "docs_sections_ai": """
+        CREATE TRIGGER IF NOT EXISTS docs_sections_ai AFTER INSERT ON docs_sections BEGIN
+            INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
+            VALUES (new.id, new.slug, new.title, new.heading, new.content);
+        END
+    """,
+    "docs_sections_ad": """
+        CREATE TRIGGER IF NOT EXISTS docs_sections_ad AFTER DELETE ON docs_sections BEGIN
+            INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
+            VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
+        END
+    """,
+    "docs_sections_au": """
+        CREATE TRIGGER IF NOT EXISTS docs_sections_au AFTER UPDATE ON docs_sections BEGIN
+            INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
+            VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
+            INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
+            VALUES (new.id, new.slug, new.title, new.heading, new.content);
+        END
+    """,
+    "components_ai": """
+        CREATE TRIGGER IF NOT EXISTS components_ai AFTER INSERT ON components BEGIN
+            INSERT INTO components_fts(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+    "components_ad": """
+        CREATE TRIGGER IF NOT EXISTS components_ad AFTER DELETE ON components BEGIN
+            INSERT INTO components_fts(components_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+    """,
+    "components_au": """
+        CREATE TRIGGER IF NOT EXISTS components_au AFTER UPDATE ON components BEGIN
+            INSERT INTO components_fts(components_fts, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO components_fts(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+}
+
+
+def _init_page_size(db_path: Path) -> None:
+    """Fix the page size on a brand-new database file.
+
+    page_size can only change on an empty database and not once WAL is
+    active, so this runs on a fresh connection before any pragmas are applied.
+    """
+    if db_path.exists() and db_path.stat().st_size > 0:
+        return
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA page_size=4096")
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
 def init_db() -> None:
     """Initialize the database with required tables."""
+    _init_page_size(get_db_path())
     with get_connection() as conn:
         cursor = conn.cursor()
 
@@ -102,6 +294,24 @@ def init_db() -> None:
             )
         """)
 
+        # One row per page, so listing pages doesn't aggregate sections
+        has_docs_pages = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'docs_pages'"
+        ).fetchone()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS docs_pages (
+                slug TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                url TEXT NOT NULL
+            )
+        """)
+        if not has_docs_pages:
+            # Backfill pages indexed before this table existed
+            cursor.execute("""
+                INSERT OR REPLACE INTO docs_pages (slug, title, url)
+                SELECT slug, MAX(title), MAX(url) FROM docs_sections GROUP BY slug
+            """)
+
         # FTS5 virtual table for full-text search
         cursor.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS docs_sections_fts USING fts5(
@@ -114,30 +324,6 @@ def init_db() -> None:
             )
         """)
 
-        # Triggers to keep FTS in sync
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS docs_sections_ai AFTER INSERT ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
-                VALUES (new.id, new.slug, new.title, new.heading, new.content);
-            END
-        """)
-
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS docs_sections_ad AFTER DELETE ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
-                VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
-            END
-        """)
-
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS docs_sections_au AFTER UPDATE ON docs_sections BEGIN
-                INSERT INTO docs_sections_fts(docs_sections_fts, rowid, slug, title, heading, content)
-                VALUES ('delete', old.id, old.slug, old.title, old.heading, old.content);
-                INSERT INTO docs_sections_fts(rowid, slug, title, heading, content)
-                VALUES (new.id, new.slug, new.title, new.heading, new.content);
-            END
-        """)
-
         # Components table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS components (
@@ -150,6 +336,29 @@ def init_db() -> None:
             )
         """)
 
+        # FTS5 index over component names and descriptions
+        has_components_fts = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'components_fts'"
+        ).fetchone()
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+                name,
+                description,
+                content='components',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        if not has_components_fts:
+            # Index components stored before this table existed
+            cursor.execute(
+                "INSERT INTO components_fts(components_fts) VALUES('rebuild')"
+            )
+
+        # Triggers to keep FTS in sync
+        for statement in _FTS_TRIGGERS.values():
+            cursor.execute(statement)
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS _meta (
                 key TEXT PRIMARY KEY,
@@ -164,6 +373,10 @@ def init_db() -> None:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_components_category ON components(category)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_components_name_lower "
+            "ON components(lower(name))"
+        )
 
         conn.commit()
 
@@ -172,11 +385,42 @@ def clear_db() -> None:
     """Clear all data from the database (for re-indexing)."""
     with get_connection() as conn:
         cursor = conn.cursor()
+        cursor.execute("DELETE FROM docs_pages")
         cursor.execute("DELETE FROM docs_sections")
         cursor.execute("DELETE FROM components")
         conn.commit()
 
 
+def disable_fts_triggers(conn: sqlite3.Connection | None = None) -> None:
+    """Drop the FTS sync triggers ahead of a bulk load.
+
+    Callers must rebuild docs_sections_fts and call enable_fts_triggers()
+    once the load is done.
+    """
+    context = get_connection() if conn is None else nullcontext(conn)
+    with context as conn:
+        for name in _FTS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def enable_fts_triggers(conn: sqlite3.Connection | None = None) -> None:
+    """Recreate the FTS sync triggers dropped by disable_fts_triggers()."""
+    context = get_connection() if conn is None else nullcontext(conn)
+    with context as conn:
+        for statement in _FTS_TRIGGERS.values():
+            conn.execute(statement)
+
+
+def rebuild_fts(conn: sqlite3.Connection | None = None) -> None:
+    """Rebuild the FTS tables from their content tables."""
+    context = get_connection() if conn is None else nullcontext(conn)
+    with context as conn:
+        conn.execute(
+            "INSERT INTO docs_sections_fts(docs_sections_fts) VALUES('rebuild')"
+        )
+        conn.execute("INSERT INTO components_fts(components_fts) VALUES('rebuild')")
+
+
 def get_meta(key: str) -> str | None:
     """Get a value from the _meta table."""
     with get_connection() as conn:
@@ -221,14 +465,63 @@ def insert_component(
     insert_components_many([(name, category, description, doc_slug, url)])
 
 
+class _CountingRows:
+    """Iterable wrapper that counts rows as executemany() consumes them.
+
+    Lets the bulk insert helpers stream rows without copying them into a
+    list just to report how many were written.
+    """
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self._rows = rows
+        self.count = 0
+
+    def __iter__(self):
+        for row in self._rows:
+            self.count += 1
+            yield row
+
+
+def insert_pages_many(
+    rows: Iterable[tuple[str, str, str]],
+    conn: sqlite3.Connection | None = None,
+) -> int:
+    """Bulk insert documentation pages, updating any that already exist."""
+    counted = _CountingRows(rows)
+    owns_connection = conn is None
+    context = get_connection() if owns_connection else nullcontext(conn)
+    with context as conn:
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO docs_pages (slug, title, url) VALUES (?, ?, ?)",
+            counted,
+        )
+        if owns_connection:
+            conn.commit()
+    return counted.count
+
+
 def insert_sections_many(
     rows: Iterable[tuple[str, str, str, int, str, int, str]],
     conn: sqlite3.Connection | None = None,
+    add_pages: bool = True,
 ) -> int:
-    """Bulk insert documentation sections."""
-    rows = list(rows)
-    if not rows:
-        return 0
+    """Bulk insert documentation sections.
+
+    Pages without a docs_pages row get one from their first section; rows
+    already written by insert_pages_many() are left as they are. Callers
+    that write every page with insert_pages_many() can pass add_pages=False
+    to skip this.
+    """
+    pages: dict[str, tuple[str, str, str]] = {}
+
+    def track_pages(rows):
+        for row in rows:
+            if row[0] not in pages:
+                pages[row[0]] = (row[0], row[1], row[6])
+            yield row
+
+    counted = _CountingRows(track_pages(rows) if add_pages else rows)
     owns_connection = conn is None
     context = get_connection() if owns_connection else nullcontext(conn)
     with context as conn:
@@ -238,35 +531,46 @@ def insert_sections_many(
             INSERT INTO docs_sections (slug, title, heading, level, content, position, url)
             VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-            rows,
+            counted,
         )
+        if pages:
+            # list_pages() and get_stats() read pages from docs_pages only
+            cursor.executemany(
+                "INSERT OR IGNORE INTO docs_pages (slug, title, url) VALUES (?, ?, ?)",
+                pages.values(),
+            )
         if owns_connection:
             conn.commit()
-    return len(rows)
+    return counted.count
 
 
 def insert_components_many(
     rows: Iterable[tuple[str, str | None, str, str | None, str | None]],
     conn: sqlite3.Connection | None = None,
 ) -> int:
-    """Bulk insert components."""
-    rows = list(rows)
-    if not rows:
-        return 0
+    """Bulk insert components, updating any that already exist."""
+    counted = _CountingRows(rows)
     owns_connection = conn is None
     context = get_connection() if owns_connection else nullcontext(conn)
     with context as conn:
         cursor = conn.cursor()
+        # An upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+        # without firing components_ad, leaving a stale components_fts entry.
         cursor.executemany(
             """
-            INSERT OR REPLACE INTO components (name, category, description, doc_slug, url)
+            INSERT INTO components (name, category, description, doc_slug, url)
             VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                category = excluded.category,
+                description = excluded.description,
+                doc_slug = excluded.doc_slug,
+                url = excluded.url
             """,
-            rows,
+            counted,
         )
         if owns_connection:
             conn.commit()
-    return len(rows)
+    return counted.count
 
 
 def search_sections(query: str, limit: int = 10, fuzzy: bool = True) -> list[DocResult]:
@@ -275,7 +579,8 @@ def search_sections(query: str, limit: int = 10, fuzzy: bool = True) -> list[Doc
     Args:
         query: Search query string.
         limit: Maximum results to return.
-        fuzzy: If True, use phrase match + prefix expansion. If False, use exact quoting.
+        fuzzy: If True, use phrase match + prefix expansion. If False, match the
+            quoted terms as given, expanding only the last one as a prefix.
     """
     cache_key = f"{query}:{limit}:{fuzzy}"
     cached = _search_cache_get(cache_key)
@@ -288,23 +593,33 @@ def search_sections(query: str, limit: int = 10, fuzzy: bool = True) -> list[Doc
         if fuzzy:
             fts_query = build_fts_query(query)
         else:
-            terms = query.strip().split()
+            # Every term is quoted, so words like "not" or "or" are matched
+            # literally rather than read as FTS5 operators.
+            terms = query.split()
             if not terms:
                 return []
-            fts_query = " ".join(f'"{term}"' for term in terms)
+            fts_query = " ".join(
+                _fts5_escape(term, prefix=i == len(terms) - 1)
+                for i, term in enumerate(terms)
+            )
 
+        # The external-content FTS table reads the docs_sections columns by
+        # rowid itself, so no JOIN is needed. url is not indexed, so it is
+        # read from the stored page row (a primary-key lookup), falling back
+        # to the section's own url. The excerpt comes from snippet(), so full
+        # section bodies never leave SQLite.
         cursor.execute(
             """
             SELECT
-                s.slug,
-                s.title,
-                s.heading,
-                s.content,
-                s.url,
-                highlight(docs_sections_fts, 3, '<b>', '</b>') as snippet,
-                bm25(docs_sections_fts) as score
-            FROM docs_sections_fts fts
-            JOIN docs_sections s ON fts.rowid = s.id
+                slug,
+                title,
+                snippet(docs_sections_fts, 3, '<b>', '</b>', ' ... ', 32) as snippet,
+                bm25(docs_sections_fts, 5.0, 3.0, 2.0, 1.0) as score,
+                coalesce(
+                    (SELECT url FROM docs_pages p WHERE p.slug = docs_sections_fts.slug),
+                    (SELECT url FROM docs_sections s WHERE s.id = docs_sections_fts.rowid)
+                ) as url
+            FROM docs_sections_fts
             WHERE docs_sections_fts MATCH ?
             ORDER BY score
             LIMIT ?
@@ -314,25 +629,23 @@ def search_sections(query: str, limit: int = 10, fuzzy: bool = True) -> list[Doc
 
         query_tokens = re.sub(r'[^\w\s]', '', query.lower()).split()
         results = []
-        for row in cursor.fetchall():
-            score = row["score"]
-            # Boost results whose title contains a query token
-            title_lower = row["title"].lower()
-            if any(t in title_lower for t in query_tokens):
-                score = score * 0.7
-            snippet = row["snippet"]
-            if not snippet or snippet == row["content"]:
-                content = row["content"]
-                snippet = content[:200] + "..." if len(content) > 200 else content
-            results.append(
-                DocResult(
-                    slug=row["slug"],
-                    title=row["title"],
-                    score=abs(score),
-                    snippet=snippet,
-                    url=row["url"],
+        cursor.arraysize = 64
+        while rows := cursor.fetchmany():
+            for row in rows:
+                score = row["score"]
+                # Boost results whose title contains a query token
+                title_lower = row["title"].lower()
+                if any(t in title_lower for t in query_tokens):
+                    score = score * 0.7
+                results.append(
+                    DocResult.model_construct(
+                        slug=row["slug"],
+                        title=row["title"],
+                        score=abs(score),
+                        snippet=row["snippet"],
+                        url=row["url"],
+                    )
                 )
-            )
 
         # Re-sort after title boosting
         results.sort(key=lambda r: r.score)
@@ -342,11 +655,11 @@ def search_sections(query: str, limit: int = 10, fuzzy: bool = True) -> list[Doc
 
 def get_page_sections(slug: str) -> DocPage | None:
     """Get all sections for a documentation page."""
-    with get_connection() as conn:
+    with raw_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT slug, title, heading, level, content, url
+            SELECT title, heading, level, content, url
             FROM docs_sections
             WHERE slug = ?
             ORDER BY position
@@ -359,16 +672,15 @@ def get_page_sections(slug: str) -> DocPage | None:
             return None
 
         sections = [
-            DocSection(
-                heading=row["heading"], level=row["level"], content=row["content"]
-            )
-            for row in rows
+            DocSection.model_construct(heading=heading, level=level, content=content)
+            for _, heading, level, content, _ in rows
         ]
 
-        return DocPage(
-            slug=rows[0]["slug"],
-            title=rows[0]["title"],
-            url=rows[0]["url"],
+        title, _, _, _, url = rows[0]
+        return DocPage.model_construct(
+            slug=slug,
+            title=title,
+            url=url,
             sections=sections,
         )
 
@@ -381,78 +693,96 @@ def get_page_sections_cached(slug: str) -> DocPage | None:
 
 def list_all_components(category: str | None = None) -> list[ComponentInfo]:
     """List all components, optionally filtered by category."""
-    with get_connection() as conn:
+    with raw_connection() as conn:
         cursor = conn.cursor()
 
         if category:
             cursor.execute(
-                "SELECT * FROM components WHERE category = ? ORDER BY name", (category,)
+                """
+                SELECT name, category, description, doc_slug, url
+                FROM components
+                WHERE category = ?
+                ORDER BY name
+                """,
+                (category,),
             )
         else:
-            cursor.execute("SELECT * FROM components ORDER BY name")
+            cursor.execute(
+                """
+                SELECT name, category, description, doc_slug, url
+                FROM components
+                ORDER BY name
+                """
+            )
 
         return [
-            ComponentInfo(
-                name=row["name"],
-                category=row["category"],
-                description=row["description"],
-                doc_slug=row["doc_slug"],
-                url=row["url"],
+            ComponentInfo.model_construct(
+                name=name,
+                category=row_category,
+                description=description,
+                doc_slug=doc_slug,
+                url=url,
             )
-            for row in cursor.fetchall()
+            for name, row_category, description, doc_slug, url in cursor
         ]
 
 
 def search_components(query: str, limit: int = 20) -> list[ComponentInfo]:
     """Search components by name or description."""
-    query = query.strip()
-    if not query:
+    # Match every word as a prefix, so "rx.but" finds rx.button
+    tokens = re.findall(r"\w+", query.lower())
+    if not tokens:
         return []
-    like_query = f"%{query}%"
-    with get_connection() as conn:
+    fts_query = " ".join(_fts5_escape(t, prefix=True) for t in tokens)
+    with raw_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
-            SELECT * FROM components
-            WHERE name LIKE ? OR description LIKE ?
-            ORDER BY name
+            SELECT c.name, c.category, c.description, c.doc_slug, c.url
+            FROM components_fts fts
+            JOIN components c ON c.id = fts.rowid
+            WHERE components_fts MATCH ?
+            ORDER BY bm25(components_fts, 10.0, 1.0), c.name
             LIMIT ?
             """,
-            (like_query, like_query, limit),
+            (fts_query, limit),
         )
         return [
-            ComponentInfo(
-                name=row["name"],
-                category=row["category"],
-                description=row["description"],
-                doc_slug=row["doc_slug"],
-                url=row["url"],
+            ComponentInfo.model_construct(
+                name=name,
+                category=category,
+                description=description,
+                doc_slug=doc_slug,
+                url=url,
             )
-            for row in cursor.fetchall()
+            for name, category, description, doc_slug, url in cursor
         ]
 
 
 def get_component_by_name(name: str) -> ComponentInfo | None:
     """Get a component by its name."""
-    # Normalize name - accept with or without rx. prefix
-    search_name = name if name.startswith("rx.") else f"rx.{name}"
+    # Normalize name - accept with or without rx. prefix, in any case
+    bare_name = name.lower().removeprefix("rx.")
+    search_name = f"rx.{bare_name}"
 
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM components WHERE name = ?", (search_name,))
+        # Look up both spellings at once, preferring the rx.-prefixed one
+        cursor.execute(
+            """
+            SELECT * FROM components
+            WHERE lower(name) IN (?, ?)
+            ORDER BY lower(name) != ?
+            LIMIT 1
+            """,
+            (search_name, bare_name, search_name),
+        )
 
         row = cursor.fetchone()
-        if not row:
-            # Try without prefix
-            cursor.execute(
-                "SELECT * FROM components WHERE name = ?", (name.replace("rx.", ""),)
-            )
-            row = cursor.fetchone()
-
         if not row:
             return None
 
-        return ComponentInfo(
+        return ComponentInfo.model_construct(
             name=row["name"],
             category=row["category"],
             description=row["description"],
@@ -469,7 +799,7 @@ def get_stats() -> dict:
         cursor.execute("SELECT COUNT(*) as count FROM docs_sections")
         sections_count = cursor.fetchone()["count"]
 
-        cursor.execute("SELECT COUNT(DISTINCT slug) as count FROM docs_sections")
+        cursor.execute("SELECT COUNT(*) as count FROM docs_pages")
         pages_count = cursor.fetchone()["count"]
 
         cursor.execute("SELECT COUNT(*) as count FROM components")
@@ -494,6 +824,12 @@ def is_index_ready() -> bool:
         return False
 
 
+def _fts5_escape(term: str, prefix: bool = False) -> str:
+    """Quote a term as an FTS5 string, optionally as a prefix query."""
+    quoted = '"' + term.replace('"', '""') + '"'
+    return f"{quoted}*" if prefix else quoted
+
+
 def build_fts_query(raw: str) -> str:
     """Build an FTS5 query with phrase match and prefix expansion."""
     tokens = re.sub(r'[^\w\s]', '', raw.lower()).split()
@@ -530,16 +866,15 @@ def clear_search_cache() -> None:
 
 def list_pages(prefix: str | None = None, limit: int = 200) -> list[DocPageInfo]:
     """List available documentation pages, optionally filtered by slug prefix."""
-    with get_connection() as conn:
+    with raw_connection() as conn:
         cursor = conn.cursor()
         if prefix:
             like_prefix = f"{prefix}%"
             cursor.execute(
                 """
-                SELECT slug, MAX(title) AS title, MAX(url) AS url
-                FROM docs_sections
+                SELECT slug, title, url
+                FROM docs_pages
                 WHERE slug LIKE ?
-                GROUP BY slug
                 ORDER BY slug
                 LIMIT ?
                 """,
@@ -547,16 +882,10 @@ def list_pages(prefix: str | None = None, limit: int = 200) -> list[DocPageInfo]
             )
         else:
             cursor.execute(
-                """
-                SELECT slug, MAX(title) AS title, MAX(url) AS url
-                FROM docs_sections
-                GROUP BY slug
-                ORDER BY slug
-                LIMIT ?
-                """,
+                "SELECT slug, title, url FROM docs_pages ORDER BY slug LIMIT ?",
                 (limit,),
             )
         return [
-            DocPageInfo(slug=row["slug"], title=row["title"], url=row["url"])
-            for row in cursor.fetchall()
+            DocPageInfo.model_construct(slug=slug, title=title, url=url)
+            for slug, title, url in cursor
         ]
@@ -1,6 +1,8 @@
 """Indexer script to clone Reflex docs and build the search index."""
 
+import functools
 import logging
+import multiprocessing
 import shutil
 import subprocess
 from pathlib import Path
@@ -25,9 +27,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+PageRow = tuple[str, str, str]
+SectionRow = tuple[str, str, str, int, str, int, str]
+ComponentRow = tuple[str, str | None, str, str | None, str | None]
+
 # Repository URL and paths
 REFLEX_WEB_REPO = "https://github.com/reflex-dev/reflex-web.git"
 DEFAULT_DOCS_SRC = Path(__file__).parent.parent.parent / "docs_src"
+# Parsed docs keyed by source mtime, so re-indexing skips unchanged files
+DEFAULT_PARSE_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "parsed"
 
 
 def clone_or_update_docs(
@@ -63,21 +71,92 @@ def clone_or_update_docs(
             logger.info("Continuing with existing docs")
     else:
         logger.info(f"Cloning Reflex docs to {docs_src}")
-        # Shallow clone for faster download
+        # Shallow, single-branch clone without tags for faster download.
+        # Every markdown blob is read during indexing, so a partial
+        # (--filter) clone would only defer those downloads.
         git.Repo.clone_from(
-            REFLEX_WEB_REPO, docs_src, depth=1, single_branch=True, branch="main"
+            REFLEX_WEB_REPO,
+            docs_src,
+            depth=1,
+            single_branch=True,
+            branch="main",
+            no_tags=True,
         )
         logger.info("Docs cloned successfully")
 
     return docs_src / "docs"
 
 
-def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
+def parse_doc_file_worker(
+    file_path: Path, docs_root: Path, cache_dir: Path | None = DEFAULT_PARSE_CACHE_DIR
+) -> tuple[
+    Path, PageRow | None, list[SectionRow], list[ComponentRow], str | None
+]:
+    """Parse one doc file into database rows; runs in a worker process.
+
+    Returns plain tuples so results are cheap to pickle back to the writer.
+    Errors are returned rather than raised so one bad file doesn't abort the
+    pool.
+    """
+    try:
+        parsed = parse_doc_file(file_path, docs_root, cache_dir)
+
+        page_row = (parsed.slug, parsed.title, parsed.url)
+        section_rows = [
+            (
+                parsed.slug,
+                parsed.title,
+                section.heading,
+                section.level,
+                section.content,
+                section.position,
+                parsed.url,
+            )
+            for section in parsed.sections
+        ]
+
+        # Collect components from frontmatter; every component on a page
+        # shares its category and description, so compute them once.
+        component_rows = []
+        if parsed.components:
+            category = get_category_from_slug(parsed.slug)
+            description = extract_component_description(parsed)
+        for component_name in parsed.components:
+            # Ensure rx. prefix
+            if not component_name.startswith("rx."):
+                component_name = f"rx.{component_name}"
+
+            component_rows.append(
+                (component_name, category, description, parsed.slug, parsed.url)
+            )
+    except Exception as e:
+        return file_path, None, [], [], str(e)
+
+    return file_path, page_row, section_rows, component_rows, None
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Return a multiprocessing context that never forks this process.
+
+    index_docs usually runs in a worker thread of the server, and forking a
+    multi-threaded process can deadlock the child.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def index_docs(
+    docs_dir: Path,
+    clear_existing: bool = True,
+    parse_cache_dir: Path | None = DEFAULT_PARSE_CACHE_DIR,
+) -> dict:
     """Index all documentation files into the database.
 
     Args:
         docs_dir: Path to the docs directory
         clear_existing: If True, clear database before indexing
+        parse_cache_dir: Directory for cached file parses, or None to disable
 
     Returns:
         Statistics about the indexing operation
@@ -122,55 +201,54 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
         "errors": 0,
     }
 
-    # Find all markdown files
-    md_files = list(docs_dir.rglob("*.md"))
+    # Find all markdown files, skipping __init__ and other non-doc files
+    md_files = [p for p in docs_dir.rglob("*.md") if not p.name.startswith("_")]
     logger.info(f"Found {len(md_files)} markdown files")
 
-    sections_batch: list[tuple[str, str, str, int, str, int, str]] = []
-    components_batch: list[tuple[str, str | None, str, str | None, str | None]] = []
-    batch_size = 1000
+    # Page rows are written once, from pages_batch; the section inserts
+    # skip their implicit docs_pages insert.
+    pages_batch: list[PageRow] = []
+    sections_batch: list[SectionRow] = []
+    components_batch: list[ComponentRow] = []
+    batch_size = 10000
+
+    # Start the workers before opening the bulk-load connection, so no
+    # worker process is created while it is open.
+    with (
+        _pool_context().Pool() as pool,
+        database.bulk_load_connection() as conn,
+    ):
+        # Populate the FTS index in one pass after the load instead of per
+        # row through the sync triggers. The DROP is rolled back with the
+        # transaction if indexing fails.
+        database.disable_fts_triggers(conn)
+
+        results = pool.imap(
+            functools.partial(
+                parse_doc_file_worker, docs_root=docs_dir, cache_dir=parse_cache_dir
+            ),
+            md_files,
+            chunksize=16,
+        )
+        for file_path, page_row, section_rows, component_rows, error in results:
+            if error is not None:
+                logger.error(f"Error processing {file_path}: {error}")
+                stats["errors"] += 1
+                continue
 
-    with database.transaction() as conn:
-        for file_path in md_files:
             try:
-                # Skip __init__.py and non-doc files
-                if file_path.name.startswith("_"):
-                    continue
-
-                # Parse the file
-                parsed = parse_doc_file(file_path, docs_dir)
-
-                # Collect sections
-                for section in parsed.sections:
-                    sections_batch.append(
-                        (
-                            parsed.slug,
-                            parsed.title,
-                            section.heading,
-                            section.level,
-                            section.content,
-                            section.position,
-                            parsed.url,
-                        )
-                    )
-
-                # Collect components from frontmatter
-                for component_name in parsed.components:
-                    # Ensure rx. prefix
-                    if not component_name.startswith("rx."):
-                        component_name = f"rx.{component_name}"
-
-                    category = get_category_from_slug(parsed.slug)
-                    description = extract_component_description(parsed)
-
-                    components_batch.append(
-                        (component_name, category, description, parsed.slug, parsed.url)
-                    )
+                pages_batch.append(page_row)
+                sections_batch.extend(section_rows)
+                components_batch.extend(component_rows)
 
                 # Flush batches
+                if len(pages_batch) >= batch_size:
+                    database.insert_pages_many(pages_batch, conn=conn)
+                    pages_batch.clear()
+
                 if len(sections_batch) >= batch_size:
                     stats["sections_indexed"] += database.insert_sections_many(
-                        sections_batch, conn=conn
+                        sections_batch, conn=conn, add_pages=False
                     )
                     sections_batch.clear()
 
@@ -190,9 +268,12 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
                 stats["errors"] += 1
 
         # Final flush
+        if pages_batch:
+            database.insert_pages_many(pages_batch, conn=conn)
+            pages_batch.clear()
         if sections_batch:
             stats["sections_indexed"] += database.insert_sections_many(
-                sections_batch, conn=conn
+                sections_batch, conn=conn, add_pages=False
             )
             sections_batch.clear()
         if components_batch:
@@ -201,6 +282,13 @@ def index_docs(docs_dir: Path, clear_existing: bool = True) -> dict:
             )
             components_batch.clear()
 
+        database.rebuild_fts(conn)
+        database.enable_fts_triggers(conn)
+
+        # Merge FTS5 segments; planner stats are refreshed when the bulk
+        # load connection closes.
+        conn.execute("INSERT INTO docs_sections_fts(docs_sections_fts) VALUES('optimize')")
+
     # Store the current git commit for incremental indexing
     try:
         result = subprocess.run(
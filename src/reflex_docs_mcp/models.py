@@ -1,6 +1,22 @@
 """Pydantic data models for MCP tool inputs and outputs."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class _ResultModel(BaseModel):
+    """Base for tool results, which are serialized far more often than built."""
+
+    _dumped: dict | None = PrivateAttr(default=None)
+
+    def to_dict(self) -> dict:
+        """Return the model_dump() dict, computed once per instance.
+
+        Results are cached by the database layer, so repeat queries reuse
+        the dict. Callers must copy it before adding keys.
+        """
+        if self._dumped is None:
+            self._dumped = self.__pydantic_serializer__.to_python(self)
+        return self._dumped
 
 
 class DocSection(BaseModel):
@@ -11,7 +27,7 @@ class DocSection(BaseModel):
     content: str = Field(description="Markdown content of the section")
 
 
-class DocResult(BaseModel):
+class DocResult(_ResultModel):
     """A search result from the docs."""
 
     slug: str = Field(
@@ -23,7 +39,7 @@ class DocResult(BaseModel):
     url: str = Field(description="Canonical docs URL")
 
 
-class DocPage(BaseModel):
+class DocPage(_ResultModel):
     """A full documentation page with sections."""
 
     slug: str = Field(description="Document slug")
@@ -32,7 +48,7 @@ class DocPage(BaseModel):
     sections: list[DocSection] = Field(description="Ordered list of sections")
 
 
-class DocPageInfo(BaseModel):
+class DocPageInfo(_ResultModel):
     """Lightweight document page metadata."""
 
     slug: str = Field(description="Document slug")
@@ -40,7 +56,7 @@ class DocPageInfo(BaseModel):
     url: str = Field(description="Canonical docs URL")
 
 
-class ComponentInfo(BaseModel):
+class ComponentInfo(_ResultModel):
     """Information about a Reflex component."""
 
     name: str = Field(description="Component name (e.g., 'rx.box')")
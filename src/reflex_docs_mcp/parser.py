@@ -1,17 +1,39 @@
 """Markdown parser for Reflex documentation files."""
 
+import bisect
+import json
+import os
 import re
 import yaml
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import NamedTuple
 
 # Base URL for Reflex docs
 REFLEX_DOCS_BASE_URL = "https://reflex.dev/docs"
 
+# Use the libyaml C loader when PyYAML was built with it; it is several
+# times faster than the pure-Python SafeLoader on frontmatter.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
-class ParsedSection:
-    """A parsed section from a markdown file."""
+# Patterns used once per section or file during indexing, compiled up front.
+# Fenced code blocks (``` or ~~~)
+_CODE_FENCE_RE = re.compile(r"```.*?```|~~~.*?~~~", re.DOTALL)
+_HEADING_RE = re.compile(r"^(#{1,3})\s+(.+)$", re.MULTILINE)
+# Code blocks, inline code, images, and links (group 1 keeps the link text)
+_FIRST_SENT_STRIP_RE = re.compile(
+    r"```.*?```|`[^`]+`|!\[[^\]]*\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)", re.DOTALL
+)
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_MD_CLEAN_RE = re.compile(r"[#*_]")
+
+
+class ParsedSection(NamedTuple):
+    """A parsed section from a markdown file.
+
+    A NamedTuple rather than a dataclass: sections are built in a tight loop
+    and never mutated, and tuples are cheaper to construct.
+    """
 
     heading: str
     level: int
@@ -19,7 +41,7 @@ class ParsedSection:
     position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDoc:
     """A fully parsed documentation file."""
 
@@ -30,6 +52,25 @@ class ParsedDoc:
     components: list[str]  # Component names from frontmatter
 
 
+def _find_frontmatter_end(content: str) -> tuple[int, int] | None:
+    """Find the closing "\\n---" line of the frontmatter.
+
+    Returns the offset of the delimiter and of the content after it, or None.
+    """
+    n = len(content)
+    idx = content.find("\n---", 3)
+    while idx != -1:
+        start = idx + 4
+        end = start
+        while end < n and content[end].isspace():
+            end += 1
+        newline = content.rfind("\n", start, end)
+        if newline != -1:
+            return idx, newline + 1
+        idx = content.find("\n---", idx + 1)
+    return None
+
+
 def extract_frontmatter(content: str) -> tuple[dict, str]:
     """Extract YAML frontmatter from markdown content.
 
@@ -39,121 +80,128 @@ def extract_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith("---"):
         return {}, content
 
-    # Find the closing ---
-    end_match = re.search(r"\n---\s*\n", content[3:])
-    if not end_match:
+    # Find the closing --- line without copying the body to search it
+    closing = _find_frontmatter_end(content)
+    if closing is None:
         return {}, content
 
     # Extract frontmatter YAML
-    frontmatter_end = end_match.end() + 3
-    frontmatter_yaml = content[3 : end_match.start() + 3]
+    yaml_end, frontmatter_end = closing
+    frontmatter_yaml = content[3:yaml_end]
     remaining_content = content[frontmatter_end:]
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_yaml) or {}
+        frontmatter = yaml.load(frontmatter_yaml, Loader=_YamlLoader) or {}
     except yaml.YAMLError:
         frontmatter = {}
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
 
     return frontmatter, remaining_content
 
 
-def split_into_sections(content: str) -> list[ParsedSection]:
-    """Split markdown content into sections by headings.
+def frontmatter_components(frontmatter: dict) -> list[str]:
+    """Return the component names declared in frontmatter.
 
-    Handles:
-    - # H1, ## H2, ### H3 headings
-    - Preserves code blocks (doesn't split on # inside code)
-    - Preserves markdown formatting
+    Accepts a single name or a list of names; anything else (a missing or
+    empty key, non-string entries) is ignored.
     """
-    sections = []
+    components = frontmatter.get("components")
+    if isinstance(components, str):
+        return [components]
+    if isinstance(components, list):
+        return [name for name in components if isinstance(name, str)]
+    return []
 
-    # Regular expression to match headings (not inside code blocks)
-    # We need to be careful not to match # inside fenced code blocks
 
-    # First, temporarily replace code blocks with placeholders
-    code_blocks = []
+def _fence_spans(content: str) -> tuple[list[int], list[int]]:
+    """Return the start and end offsets of fenced code blocks, in order."""
+    starts: list[int] = []
+    ends: list[int] = []
+    # Many pages have no fences; a substring check is far cheaper than the
+    # DOTALL regex scan.
+    if "```" not in content and "~~~" not in content:
+        return starts, ends
+    for match in _CODE_FENCE_RE.finditer(content):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
 
-    def save_code_block(match):
-        code_blocks.append(match.group(0))
-        return f"<<<CODE_BLOCK_{len(code_blocks) - 1}>>>"
 
-    # Match fenced code blocks (``` or ~~~)
-    content_protected = re.sub(
-        r"```.*?```|~~~.*?~~~", save_code_block, content, flags=re.DOTALL
-    )
+def _in_fence(pos: int, starts: list[int], ends: list[int]) -> bool:
+    """Return True if offset pos falls inside one of the fence spans."""
+    i = bisect.bisect_right(starts, pos) - 1
+    return i >= 0 and pos < ends[i]
 
-    # Now split by headings
-    heading_pattern = re.compile(r"^(#{1,3})\s+(.+)$", re.MULTILINE)
 
-    # Find all headings
-    matches = list(heading_pattern.finditer(content_protected))
+def split_into_sections(content: str) -> list[ParsedSection]:
+    """Split markdown content into sections by headings.
+
+    Handles:
+    - # H1, ## H2, ### H3 headings
+    - Preserves code blocks (doesn't split on # inside code)
+    - Preserves markdown formatting
+    """
+    sections: list[ParsedSection] = []
+
+    # Headings are matched on the original text; any match that starts
+    # inside a fenced code block is skipped, so sections can be sliced
+    # straight out of content without rewriting the code blocks.
+    fence_starts, fence_ends = _fence_spans(content)
+
+    # Each section is emitted once the next heading (or the end of the
+    # file) bounds it, so only the previous match is kept around.
+    prev: re.Match[str] | None = None
+    for match in _HEADING_RE.finditer(content):
+        if _in_fence(match.start(), fence_starts, fence_ends):
+            continue
+        if prev is None:
+            # Handle any content before the first heading
+            content_before = content[: match.start()].strip()
+            if content_before:
+                sections.append(
+                    ParsedSection(
+                        heading="", level=0, content=content_before, position=0
+                    )
+                )
+        else:
+            end = match.start()
+            sections.append(_heading_section(prev, content, end, len(sections)))
+        prev = match
 
-    if not matches:
+    if prev is None:
         # No headings, return entire content as one section
-        # Restore code blocks
-        for i, block in enumerate(code_blocks):
-            content = content.replace(f"<<<CODE_BLOCK_{i}>>>", block)
         return [ParsedSection(heading="", level=0, content=content.strip(), position=0)]
 
-    # Process each section
-    for i, match in enumerate(matches):
-        level = len(match.group(1))
-        heading = match.group(2).strip()
+    sections.append(_heading_section(prev, content, len(content), len(sections)))
+    return sections
 
-        # Get content between this heading and the next (or end of file)
-        start = match.end()
-        if i + 1 < len(matches):
-            end = matches[i + 1].start()
-        else:
-            end = len(content_protected)
-
-        section_content = content_protected[start:end].strip()
-
-        # Restore code blocks in this section
-        for j, block in enumerate(code_blocks):
-            section_content = section_content.replace(f"<<<CODE_BLOCK_{j}>>>", block)
-
-        sections.append(
-            ParsedSection(
-                heading=heading, level=level, content=section_content, position=i
-            )
-        )
-
-    # Handle any content before the first heading
-    content_before = content_protected[: matches[0].start()].strip()
-    if content_before:
-        for j, block in enumerate(code_blocks):
-            content_before = content_before.replace(f"<<<CODE_BLOCK_{j}>>>", block)
-        sections.insert(
-            0, ParsedSection(heading="", level=0, content=content_before, position=-1)
-        )
-        # Re-number positions
-        for i, section in enumerate(sections):
-            section.position = i
 
-    return sections
+def _heading_section(
+    match: re.Match[str], content: str, end: int, position: int
+) -> ParsedSection:
+    """Build the section for a heading match, ending at offset end."""
+    return ParsedSection(
+        heading=match.group(2).strip(),
+        level=len(match.group(1)),
+        content=content[match.end() : end].strip(),
+        position=position,
+    )
 
 
 def extract_first_sentence(content: str) -> str:
     """Extract the first sentence from content for a description."""
-    # Remove code blocks
-    content = re.sub(r"```.*?```", "", content, flags=re.DOTALL)
-    # Remove inline code
-    content = re.sub(r"`[^`]+`", "", content)
-    # Remove markdown links but keep text
-    content = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", content)
-    # Remove images
-    content = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", content)
-    # Remove special blocks (md alert, md definition, etc.)
-    content = re.sub(r"```md\s+\w+.*?```", "", content, flags=re.DOTALL)
+    # Remove code blocks (including md alert/definition blocks), inline code
+    # and images, and replace links with their text, in a single pass
+    content = _FIRST_SENT_STRIP_RE.sub(lambda m: m.group(1) or "", content)
 
     # Find first sentence
     content = content.strip()
-    sentences = re.split(r"(?<=[.!?])\s+", content)
+    sentences = _SENT_SPLIT_RE.split(content, maxsplit=1)
     if sentences:
         first = sentences[0].strip()
         # Clean up any remaining markdown
-        first = re.sub(r"[#*_]", "", first)
+        first = _MD_CLEAN_RE.sub("", first)
         return first[:200] if len(first) > 200 else first
 
     return content[:200] if content else "No description available."
@@ -166,39 +214,107 @@ def file_path_to_slug(file_path: Path, docs_root: Path) -> str:
     """
     relative = file_path.relative_to(docs_root)
     # Remove .md or .mdx extension
-    slug = str(relative.with_suffix("")).replace("\\", "/")
-    return slug
+    return relative.with_suffix("").as_posix()
+
+
+def _read_doc(file_path: Path) -> str:
+    """Read a markdown file as text with newlines normalized to \\n.
+
+    Reads bytes and decodes once, skipping the TextIOWrapper that
+    read_text() sets up per file.
+    """
+    content = file_path.read_bytes().decode("utf-8")
+    # Match the universal-newline translation of text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+# Bump when parse output changes so stale cache entries are ignored.
+_PARSE_CACHE_VERSION = 3
+
+
+def _load_cached_doc(cache_file: Path, stat: os.stat_result) -> ParsedDoc | None:
+    """Return the cached parse of a file if it matches the file's stat."""
+    try:
+        data = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        data.get("version") != _PARSE_CACHE_VERSION
+        or data.get("mtime_ns") != stat.st_mtime_ns
+        or data.get("size") != stat.st_size
+    ):
+        return None
+    doc = data["doc"]
+    return ParsedDoc(
+        slug=doc["slug"],
+        title=doc["title"],
+        url=doc["url"],
+        # asdict() keeps sections as tuples, so they round-trip as lists
+        sections=[ParsedSection(*section) for section in doc["sections"]],
+        components=doc["components"],
+    )
 
 
-def parse_doc_file(file_path: Path, docs_root: Path) -> ParsedDoc:
+def _store_cached_doc(
+    cache_file: Path, stat: os.stat_result, parsed: ParsedDoc
+) -> None:
+    """Write a parse result to the cache; failures only cost a re-parse."""
+    data = {
+        "version": _PARSE_CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "doc": asdict(parsed),
+    }
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(data), encoding="utf-8")
+        # Atomic, so concurrent indexer workers never see a partial file
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def parse_doc_file(
+    file_path: Path, docs_root: Path, cache_dir: Path | None = None
+) -> ParsedDoc:
     """Parse a markdown documentation file.
 
     Args:
         file_path: Path to the markdown file
         docs_root: Root directory of the docs (e.g., docs_src/docs)
+        cache_dir: If set, reuse a cached parse from this directory while the
+            file's mtime and size are unchanged, and cache fresh parses there
 
     Returns:
         ParsedDoc with all extracted information
     """
-    content = file_path.read_text(encoding="utf-8")
-
-    # Extract frontmatter
-    frontmatter, body = extract_frontmatter(content)
-
     # Get slug and URL
     slug = file_path_to_slug(file_path, docs_root)
     url = f"{REFLEX_DOCS_BASE_URL}/{slug}"
 
+    if cache_dir is not None:
+        stat = file_path.stat()
+        cache_file = cache_dir / f"{slug}.json"
+        cached = _load_cached_doc(cache_file, stat)
+        if cached is not None:
+            return cached
+
+    content = _read_doc(file_path)
+
+    # Extract frontmatter
+    frontmatter, body = extract_frontmatter(content)
+
     # Extract components from frontmatter
-    components = frontmatter.get("components", [])
-    if isinstance(components, str):
-        components = [components]
+    components = frontmatter_components(frontmatter)
 
     # Split into sections
     sections = split_into_sections(body)
 
     # Determine title from first H1 or filename
-    title = None
+    title: str | None = None
     for section in sections:
         if section.level == 1 and section.heading:
             title = section.heading
@@ -208,9 +324,12 @@ def parse_doc_file(file_path: Path, docs_root: Path) -> ParsedDoc:
         # Use filename as title
         title = file_path.stem.replace("_", " ").replace("-", " ").title()
 
-    return ParsedDoc(
+    parsed = ParsedDoc(
         slug=slug, title=title, url=url, sections=sections, components=components
     )
+    if cache_dir is not None:
+        _store_cached_doc(cache_file, stat, parsed)
+    return parsed
 
 
 def extract_component_description(parsed_doc: ParsedDoc) -> str:
@@ -226,7 +345,7 @@ def get_category_from_slug(slug: str) -> str | None:
 
     Example: library/layout/box -> layout
     """
-    parts = slug.split("/")
+    parts = slug.split("/", 2)
     if len(parts) >= 2 and parts[0] == "library":
         return parts[1]
     return None
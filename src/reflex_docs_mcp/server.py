@@ -83,12 +83,14 @@ def search_docs(
     limit = max(1, min(limit, _MAX_SEARCH_RESULTS))
     if include_content:
         limit = min(limit, 5)
-    logger.info(f"Searching docs: {query} (limit={limit}, fuzzy={fuzzy})")
+    logger.info("Searching docs: %s (limit=%s, fuzzy=%s)", query, limit, fuzzy)
 
     try:
         results = database.search_sections(query, limit=limit, fuzzy=fuzzy)
-        out = [result.model_dump() for result in results]
+        out = [result.to_dict() for result in results]
         if include_content:
+            # Copy the cached dicts before adding page content to them
+            out = [dict(item) for item in out]
             for item in out:
                 page = database.get_page_sections_cached(item["slug"])
                 if page:
@@ -97,7 +99,7 @@ def search_docs(
                     )
         return out
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.error("Search error: %s", e)
         return []
 
 
@@ -116,21 +118,22 @@ def get_doc(slug: str, extract_code: bool = False) -> dict | None:
         get_doc("library/layout/box")
         get_doc("state/overview", extract_code=True)
     """
-    logger.info(f"Getting doc: {slug}")
+    logger.info("Getting doc: %s", slug)
 
     try:
         page = database.get_page_sections_cached(slug)
         if not page:
             return None
-        result = page.model_dump()
+        result = page.to_dict()
         if extract_code:
+            result = dict(result)
             full_content = "\n\n".join(s.content for s in page.sections)
             result["code_blocks"] = re.findall(
                 r"```\w*\n(.*?)```", full_content, re.DOTALL
             )
         return result
     except Exception as e:
-        logger.error(f"Get doc error: {e}")
+        logger.error("Get doc error: %s", e)
         return None
 
 
@@ -149,13 +152,13 @@ def list_components(category: str | None = None) -> list[dict]:
         list_components("layout")
         list_components("forms")
     """
-    logger.info(f"Listing components (category: {category})")
+    logger.info("Listing components (category: %s)", category)
 
     try:
         components = database.list_all_components(category=category)
-        return [comp.model_dump() for comp in components]
+        return [comp.to_dict() for comp in components]
     except Exception as e:
-        logger.error(f"List components error: {e}")
+        logger.error("List components error: %s", e)
         return []
 
 
@@ -171,13 +174,13 @@ def search_components(query: str, limit: int = 20) -> list[dict]:
         List of matching components with name, category, description, and documentation URL
     """
     limit = max(1, min(limit, _MAX_SEARCH_RESULTS))
-    logger.info(f"Searching components: {query} (limit={limit})")
+    logger.info("Searching components: %s (limit=%s)", query, limit)
 
     try:
         results = database.search_components(query, limit=limit)
-        return [comp.model_dump() for comp in results]
+        return [comp.to_dict() for comp in results]
     except Exception as e:
-        logger.error(f"Search components error: {e}")
+        logger.error("Search components error: %s", e)
         return []
 
 
@@ -196,15 +199,15 @@ def get_component(name: str) -> dict | None:
         get_component("rx.box")
         get_component("button")
     """
-    logger.info(f"Getting component: {name}")
+    logger.info("Getting component: %s", name)
 
     try:
         component = database.get_component_by_name(name)
         if component:
-            return component.model_dump()
+            return component.to_dict()
         return None
     except Exception as e:
-        logger.error(f"Get component error: {e}")
+        logger.error("Get component error: %s", e)
         return None
 
 
@@ -220,13 +223,13 @@ def list_pages(prefix: str | None = None, limit: int = 200) -> list[dict]:
         List of pages with slug, title, and URL
     """
     limit = max(1, min(limit, _MAX_PAGES_RESULTS))
-    logger.info(f"Listing pages (prefix: {prefix}, limit={limit})")
+    logger.info("Listing pages (prefix: %s, limit=%s)", prefix, limit)
 
     try:
         pages = database.list_pages(prefix=prefix, limit=limit)
-        return [page.model_dump() for page in pages]
+        return [page.to_dict() for page in pages]
     except Exception as e:
-        logger.error(f"List pages error: {e}")
+        logger.error("List pages error: %s", e)
         return []
 
 
@@ -240,7 +243,7 @@ def get_stats() -> dict:
     try:
         return database.get_stats()
     except Exception as e:
-        logger.error(f"Get stats error: {e}")
+        logger.error("Get stats error: %s", e)
         return {"error": str(e)}
 
 
@@ -255,7 +258,7 @@ def get_code_examples(topic: str, limit: int = 5) -> dict:
     Returns:
         Dict with topic, count, and list of code examples with source info
     """
-    logger.info(f"Getting code examples: {topic} (limit={limit})")
+    logger.info("Getting code examples: %s (limit=%s)", topic, limit)
     try:
         results = database.search_sections(topic, limit=20)
         topic_tokens = topic.lower().split()
@@ -286,7 +289,7 @@ def get_code_examples(topic: str, limit: int = 5) -> dict:
                 break
         return {"topic": topic, "count": len(examples), "examples": examples}
     except Exception as e:
-        logger.error(f"Get code examples error: {e}")
+        logger.error("Get code examples error: %s", e)
         return {"topic": topic, "count": 0, "examples": [], "error": str(e)}
 
 
@@ -301,7 +304,7 @@ def decode_error(error_text: str, context: str = "") -> dict:
     Returns:
         Dict with error class, rx symbols, relevant docs, and search queries used
     """
-    logger.info(f"Decoding error: {error_text[:80]}...")
+    logger.info("Decoding error: %s...", error_text[:80])
     try:
         # Extract exception class
         match = re.search(r"(\w+Error|\w+Exception|\w+Warning)", error_text)
@@ -343,7 +346,7 @@ def decode_error(error_text: str, context: str = "") -> dict:
             "search_queries_used": queries_used,
         }
     except Exception as e:
-        logger.error(f"Decode error error: {e}")
+        logger.error("Decode error error: %s", e)
         return {
             "error_class": None,
             "rx_symbols": [],
@@ -364,7 +367,7 @@ def get_changelog(version: str = "", limit: int = 5) -> dict:
     Returns:
         Dict with requested version, count, source URL, and release sections
     """
-    logger.info(f"Getting changelog: version={version!r}, limit={limit}")
+    logger.info("Getting changelog: version=%r, limit=%s", version, limit)
     source_url = "https://raw.githubusercontent.com/reflex-dev/reflex/main/CHANGELOG.md"
     try:
         text = fetch(source_url, ttl=3600)
@@ -402,7 +405,7 @@ def get_changelog(version: str = "", limit: int = 5) -> dict:
             "releases": releases,
         }
     except Exception as e:
-        logger.error(f"Get changelog error: {e}")
+        logger.error("Get changelog error: %s", e)
         return {
             "requested_version": version,
             "returned_count": 0,
@@ -423,7 +426,7 @@ def get_migration_guide(from_version: str, to_version: str) -> dict:
     Returns:
         Dict with breaking changes, relevant docs, and changelog section
     """
-    logger.info(f"Getting migration guide: {from_version} -> {to_version}")
+    logger.info("Getting migration guide: %s -> %s", from_version, to_version)
     try:
         changelog = get_changelog(version=to_version, limit=1)
         changelog_section = ""
@@ -469,7 +472,7 @@ def get_migration_guide(from_version: str, to_version: str) -> dict:
             "changelog_section": changelog_section,
         }
     except Exception as e:
-        logger.error(f"Get migration guide error: {e}")
+        logger.error("Get migration guide error: %s", e)
         return {
             "from_version": from_version,
             "to_version": to_version,
@@ -490,7 +493,7 @@ def search_api_reference(symbol: str) -> dict:
     Returns:
         Dict with symbol info, headings, code blocks, and tables
     """
-    logger.info(f"Searching API reference: {symbol}")
+    logger.info("Searching API reference: %s", symbol)
     slug = symbol.lower().replace(".", "-").replace("_", "-")
     url = f"https://reflex.dev/docs/api-reference/{slug}/"
     try:
@@ -529,7 +532,7 @@ def search_api_reference(symbol: str) -> dict:
             "tables": [],
         }
     except Exception as e:
-        logger.error(f"Search API reference error: {e}")
+        logger.error("Search API reference error: %s", e)
         return {
             "symbol": symbol,
             "source": "error",
@@ -551,7 +554,7 @@ def get_component_props(name: str, filter: str = "") -> dict:
     Returns:
         Dict with component name, total props count, and filtered props list
     """
-    logger.info(f"Getting component props: {name} (filter={filter!r})")
+    logger.info("Getting component props: %s (filter=%r)", name, filter)
     try:
         comp = database.get_component_by_name(name)
         if not comp:
@@ -598,7 +601,7 @@ def get_component_props(name: str, filter: str = "") -> dict:
             "props": props,
         }
     except Exception as e:
-        logger.error(f"Get component props error: {e}")
+        logger.error("Get component props error: %s", e)
         return {
             "component": name,
             "total_props": 0,
@@ -618,7 +621,7 @@ def list_recipes(category: str = "") -> dict:
     Returns:
         Dict with category filter, count, and list of recipes with summaries
     """
-    logger.info(f"Listing recipes: category={category!r}")
+    logger.info("Listing recipes: category=%r", category)
     try:
         pages = database.list_pages(prefix="recipes")
         if category:
@@ -644,7 +647,7 @@ def list_recipes(category: str = "") -> dict:
             "recipes": recipes,
         }
     except Exception as e:
-        logger.error(f"List recipes error: {e}")
+        logger.error("List recipes error: %s", e)
         return {
             "category_filter": category,
             "count": 0,
@@ -688,7 +691,7 @@ def main():
     database.init_db()
 
     # Run the server
-    logger.info(f"Starting Reflex Docs MCP Server ({args.transport})")
+    logger.info("Starting Reflex Docs MCP Server (%s)", args.transport)
 
     if args.transport == "stdio":
         mcp.run()
@@ -0,0 +1,22 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from reflex_docs_mcp import database
+
+
+def _reset_database_state() -> None:
+    database.close_all_connections()
+    database.get_db_path.cache_clear()
+    database.get_page_sections_cached.cache_clear()
+    database.clear_search_cache()
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Point the database module at a fresh, initialized database file."""
+    monkeypatch.setenv("REFLEX_DOCS_DB_PATH", str(tmp_path / "reflex_docs.db"))
+    _reset_database_state()
+    database.init_db()
+    yield database
+    _reset_database_state()
@@ -0,0 +1,133 @@
+"""Tests for the SQLite storage and search layer."""
+
+import gc
+import threading
+
+from reflex_docs_mcp import database
+
+BOX = ("rx.box", "layout", "A container for layout.", "library/layout/box", "u/box")
+TEXT = ("rx.text", "typography", "Displays text.", "library/typography/text", "u/t")
+
+
+def _fts_integrity_check(table: str) -> None:
+    with database.get_connection() as conn:
+        conn.execute(f"INSERT INTO {table}({table}, rank) VALUES('integrity-check', 1)")
+
+
+# --- connections ---
+
+class TestConnections:
+    def test_thread_connections_closed_on_thread_exit(self, db):
+        threads = [threading.Thread(target=db.list_pages) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+        del threads, thread
+        gc.collect()
+        assert threading.get_ident() in db._connections
+        assert len(db._connections) == 1
+
+    def test_reconnects_after_close_all(self, db):
+        db.list_pages()
+        db.close_all_connections()
+        assert db.list_pages() == []
+
+
+# --- search_sections ---
+
+class TestSearchSections:
+    def test_exact_search_keeps_operator_words(self, db):
+        db.insert_sections_many(
+            [
+                ("state/a", "A", "", 1, "The state is not updating.", 0, "u/a"),
+                ("state/b", "B", "", 1, "The state is updating.", 0, "u/b"),
+            ]
+        )
+        results = db.search_sections("state not updating", fuzzy=False)
+        assert [(r.slug, r.url) for r in results] == [("state/a", "u/a")]
+        assert db.search_sections("AND", fuzzy=False) == []
+
+    def test_exact_search_escapes_quotes_and_prefixes_last_term(self, db):
+        db.insert_section("style/a", "A", "", 1, 'Say "hello" to theming.', 0, "u")
+        assert [r.slug for r in db.search_sections('"hello', fuzzy=False)] == [
+            "style/a"
+        ]
+        assert [r.slug for r in db.search_sections("hello them", fuzzy=False)] == [
+            "style/a"
+        ]
+        # Only the last term is a prefix
+        assert db.search_sections("hel theming", fuzzy=False) == []
+
+
+# --- pages ---
+
+class TestPages:
+    def test_sections_create_missing_pages(self, db):
+        db.insert_section("state/overview", "State", "", 1, "Intro.", 0, "u/state")
+        db.insert_sections_many(
+            [
+                ("state/vars", "Vars", "", 1, "Vars.", 0, "u/vars"),
+                ("state/vars", "Vars", "Base", 2, "Base vars.", 1, "u/vars"),
+            ]
+        )
+
+        assert [(p.slug, p.title, p.url) for p in db.list_pages(prefix="state/")] == [
+            ("state/overview", "State", "u/state"),
+            ("state/vars", "Vars", "u/vars"),
+        ]
+        assert db.get_stats() == {"sections": 3, "pages": 2, "components": 0}
+
+    def test_sections_keep_existing_page_rows(self, db):
+        db.insert_pages_many([("state/overview", "State Overview", "u/state")])
+        db.insert_section("state/overview", "State", "", 1, "Intro.", 0, "u/state")
+        assert [p.title for p in db.list_pages()] == ["State Overview"]
+
+    def test_sections_without_pages(self, db):
+        rows = [("state/overview", "State", "", 1, "Intro.", 0, "u/state")]
+        assert db.insert_sections_many(rows, add_pages=False) == 1
+        assert db.list_pages() == []
+        # Search falls back to the section's url without a page row
+        assert [r.url for r in db.search_sections("intro")] == ["u/state"]
+
+
+# --- components ---
+
+class TestComponents:
+    def test_search_components(self, db):
+        db.insert_components_many([BOX, TEXT])
+        assert [c.name for c in db.search_components("contain")] == ["rx.box"]
+        assert [c.name for c in db.search_components("rx.te")] == ["rx.text"]
+        assert db.search_components("!!") == []
+
+    def test_reinsert_keeps_fts_in_sync(self, db):
+        db.insert_components_many([BOX])
+        db.insert_components_many([(*BOX[:2], "A zebra.", *BOX[3:])])
+
+        assert db.search_components("container") == []
+        assert [c.name for c in db.search_components("zebra")] == ["rx.box"]
+        _fts_integrity_check("components_fts")
+
+    def test_rebuild_fts(self, db):
+        db.disable_fts_triggers()
+        db.insert_components_many([BOX, TEXT])
+        assert db.search_components("container") == []
+
+        db.rebuild_fts()
+        db.enable_fts_triggers()
+        assert [c.name for c in db.search_components("container")] == ["rx.box"]
+        _fts_integrity_check("components_fts")
+        _fts_integrity_check("docs_sections_fts")
+
+    def test_get_component_by_name(self, db):
+        db.insert_components_many([BOX, TEXT])
+        for name in ("rx.box", "box", "RX.Box", "Box"):
+            assert db.get_component_by_name(name).name == "rx.box"
+        assert db.get_component_by_name("rx.missing") is None
+
+    def test_get_component_by_name_prefers_rx_prefix(self, db):
+        db.insert_components_many([("foreach", None, "Bare.", None, None), TEXT])
+        assert db.get_component_by_name("rx.foreach").name == "foreach"
+
+        db.insert_components_many([("rx.foreach", None, "Prefixed.", None, None)])
+        for name in ("foreach", "rx.foreach", "ForEach"):
+            assert db.get_component_by_name(name).name == "rx.foreach"
@@ -0,0 +1,38 @@
+"""Tests for building the index from a docs tree."""
+
+from reflex_docs_mcp import indexer
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_index_docs(db, tmp_path, monkeypatch):
+    monkeypatch.setenv("REFLEX_DOCS_FORCE_CLONE", "1")
+    docs = tmp_path / "docs_src" / "docs"
+    _write(
+        docs / "library" / "layout" / "box.md",
+        "---\ncomponents:\n  - box\n---\n# Box\n\nA container for layout.\n\n"
+        "## Usage\n\nWrap children in a box.\n",
+    )
+    _write(docs / "state" / "overview.md", "# State\n\nState holds your app data.\n")
+    _write(docs / "_private.md", "# Skipped\n")
+
+    stats = indexer.index_docs(docs, parse_cache_dir=None)
+    assert stats == {
+        "files_processed": 2,
+        "sections_indexed": 3,
+        "components_indexed": 1,
+        "errors": 0,
+    }
+
+    assert [(p.slug, p.title) for p in db.list_pages()] == [
+        ("library/layout/box", "Box"),
+        ("state/overview", "State"),
+    ]
+    assert [r.slug for r in db.search_sections("holds", fuzzy=False)] == [
+        "state/overview"
+    ]
+    assert [c.name for c in db.search_components("container")] == ["rx.box"]
+    assert db.get_stats() == {"sections": 3, "pages": 2, "components": 1}
@@ -0,0 +1,134 @@
+"""Tests for the markdown parser used by the indexer."""
+
+from reflex_docs_mcp import parser
+
+
+# --- split_into_sections ---
+
+class TestSplitIntoSections:
+    def test_no_headings(self):
+        sections = parser.split_into_sections("\nJust some text.\n")
+        assert len(sections) == 1
+        assert sections[0].heading == ""
+        assert sections[0].level == 0
+        assert sections[0].content == "Just some text."
+
+    def test_headings_and_levels(self):
+        sections = parser.split_into_sections(
+            "# Title\n\nIntro.\n\n## Usage\n\nUse it.\n\n### Detail\n\nMore.\n"
+        )
+        assert [(s.heading, s.level, s.content) for s in sections] == [
+            ("Title", 1, "Intro."),
+            ("Usage", 2, "Use it."),
+            ("Detail", 3, "More."),
+        ]
+        assert [s.position for s in sections] == [0, 1, 2]
+
+    def test_ignores_headings_inside_code_fences(self):
+        content = (
+            "# Title\n\n```python\n# not a heading\nx = 1\n```\n\n"
+            "~~~\n## also not\n~~~\n\n## Real\n\nBody.\n"
+        )
+        sections = parser.split_into_sections(content)
+        assert [s.heading for s in sections] == ["Title", "Real"]
+        assert "# not a heading" in sections[0].content
+        assert "## also not" in sections[0].content
+
+    def test_content_before_first_heading(self):
+        sections = parser.split_into_sections("Preamble.\n\n# Title\n\nBody.\n")
+        assert [(s.heading, s.position) for s in sections] == [("", 0), ("Title", 1)]
+        assert sections[0].content == "Preamble."
+
+
+# --- extract_frontmatter ---
+
+class TestExtractFrontmatter:
+    def test_frontmatter(self):
+        meta, body = parser.extract_frontmatter(
+            "---\ncomponents:\n  - rx.box\n---\n# Box\n"
+        )
+        assert meta == {"components": ["rx.box"]}
+        assert body == "# Box\n"
+
+    def test_no_frontmatter(self):
+        meta, body = parser.extract_frontmatter("# Box\n")
+        assert meta == {}
+        assert body == "# Box\n"
+
+    def test_unclosed_frontmatter(self):
+        content = "---\ntitle: x\n# Box\n"
+        assert parser.extract_frontmatter(content) == ({}, content)
+
+    def test_non_mapping_frontmatter(self):
+        assert parser.extract_frontmatter("---\n- a\n---\nBody\n") == ({}, "Body\n")
+
+    def test_frontmatter_components(self):
+        assert parser.frontmatter_components({"components": "rx.box"}) == ["rx.box"]
+        assert parser.frontmatter_components({"components": ["rx.box", 1]}) == ["rx.box"]
+        assert parser.frontmatter_components({"components": None}) == []
+        assert parser.frontmatter_components({}) == []
+
+
+# --- extract_first_sentence ---
+
+class TestExtractFirstSentence:
+    def test_strips_markdown(self):
+        content = "Use [links](http://x) and `code` here. Second sentence."
+        assert parser.extract_first_sentence(content) == "Use links and  here."
+
+    def test_skips_code_blocks(self):
+        content = "```python\nx = 1\n```\nThe *box* component. More."
+        assert parser.extract_first_sentence(content) == "The box component."
+
+
+# --- parse_doc_file ---
+
+class TestParseDocFile:
+    def test_parse(self, tmp_path):
+        doc = tmp_path / "library" / "layout" / "box.md"
+        doc.parent.mkdir(parents=True)
+        doc.write_text("---\ncomponents: box\n---\n# Box\n\nA container.\n")
+
+        parsed = parser.parse_doc_file(doc, tmp_path)
+        assert parsed.slug == "library/layout/box"
+        assert parsed.title == "Box"
+        assert parsed.url == "https://reflex.dev/docs/library/layout/box"
+        assert parsed.components == ["box"]
+        assert parsed.sections[0].content == "A container."
+
+    def test_crlf_newlines(self, tmp_path):
+        doc = tmp_path / "box.md"
+        doc.write_bytes(
+            b"---\r\ncomponents: box\r\n---\r\n# Box\r\n\r\nA container.\r\n"
+        )
+
+        parsed = parser.parse_doc_file(doc, tmp_path)
+        assert parsed.components == ["box"]
+        assert parsed.sections[0].content == "A container."
+
+    def test_title_falls_back_to_filename(self, tmp_path):
+        doc = tmp_path / "getting_started-intro.md"
+        doc.write_text("## Setup\n\nInstall it.\n")
+
+        parsed = parser.parse_doc_file(doc, tmp_path)
+        assert parsed.title == "Getting Started Intro"
+
+    def test_cache_roundtrip(self, tmp_path):
+        docs = tmp_path / "docs"
+        doc = docs / "state" / "overview.md"
+        doc.parent.mkdir(parents=True)
+        doc.write_text("# State\n\nIntro.\n\n## Vars\n\nBase vars.\n")
+        cache_dir = tmp_path / "cache"
+
+        parsed = parser.parse_doc_file(doc, docs, cache_dir)
+        assert (cache_dir / "state" / "overview.json").exists()
+        assert parser.parse_doc_file(doc, docs, cache_dir) == parsed
+
+        # A changed file invalidates its cache entry
+        doc.write_text("# State\n\nRewritten intro.\n")
+        reparsed = parser.parse_doc_file(doc, docs, cache_dir)
+        assert reparsed.sections[0].content == "Rewritten intro."
+
+    def test_category_from_slug(self):
+        assert parser.get_category_from_slug("library/layout/box") == "layout"
+        assert parser.get_category_from_slug("state/overview") is None